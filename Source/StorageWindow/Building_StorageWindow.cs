@@ -61,7 +61,10 @@ namespace StorageWindow
 
             // Get a copy of the items to avoid collection modification issues
             var itemsToForward = slotGroup.HeldThings.ToList();
-            
+
+            // Look up the colonist used for forbidden checks once instead of per item
+            Pawn forbiddenCheckPawn = Map.mapPawns.FreeColonists.FirstOrDefault();
+
             foreach (Thing item in itemsToForward)
             {
                 // Skip if item is reserved by anyone (more comprehensive check)
@@ -69,7 +72,7 @@ namespace StorageWindow
                     continue;
                 
                 // Skip if item is forbidden for player faction
-                if (item.IsForbidden(Map.mapPawns.FreeColonists.FirstOrDefault()))
+                if (item.IsForbidden(forbiddenCheckPawn))
                     continue;
 
                 // Try to find better storage for this item
@@ -142,14 +145,15 @@ namespace StorageWindow
         private Pawn FindAvailableHauler(Thing item)
         {
             // Find colonists who can haul and are available
+            // Cheap state and distance checks run first so pathfinding only happens for nearby candidates
             return Map.mapPawns.FreeColonists
-                .Where(p => !p.Downed && 
-                           !p.Dead && 
+                .Where(p => !p.Downed &&
+                           !p.Dead &&
+                           p.Position.DistanceToSquared(item.Position) <= 900 && // Max distance of 30 tiles (30^2 = 900)
                            p.workSettings?.WorkIsActive(WorkTypeDefOf.Hauling) == true &&
                            !p.jobs.curJob?.def?.alwaysShowWeapon == true && // Skip pawns with combat jobs
                            p.CanReach(item, PathEndMode.ClosestTouch, Danger.Deadly) && // Use Deadly to match game's hauling logic
-                           HaulAIUtility.PawnCanAutomaticallyHaulFast(p, item, false) &&
-                           p.Position.DistanceToSquared(item.Position) <= 900) // Max distance of 30 tiles (30^2 = 900)
+                           HaulAIUtility.PawnCanAutomaticallyHaulFast(p, item, false))
                 .OrderBy(p => p.Position.DistanceToSquared(item.Position))
                 .FirstOrDefault();
         }
@@ -206,7 +210,7 @@ namespace StorageWindow
             foreach (Thing thing in thingList)
             {
                 // Check if the Thing is a building categorized as a wall.
-                if (thing.def != null && thing.def.defName == "Wall")
+                if (thing.def == ThingDefOf.Wall)
                 {
                     return 1; // Strong alignment with walls.
                 }